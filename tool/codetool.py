@@ -1,7 +1,7 @@
 """
 codetool.py
 
-A Python script/tool (678 lines) designed to assist users in writing code by providing code generation, formatting, linting, and snippet suggestions for multiple languages.
+A Python script/tool designed to assist users in writing code by providing code generation, formatting, linting, and snippet suggestions for multiple languages.
 
 Features:
 - Generates starter code/templates for Java, Perl, Lua, Kotlin, and Python
@@ -16,244 +16,339 @@ Usage:
 
 import os
 import sys
-import textwrap
+import threading
+from functools import lru_cache
+from io import StringIO
+
+__all__ = (
+    'LANGUAGES',
+    'get_snippet',
+    'format_code',
+    'lint_code',
+    'doc_link',
+    'generate_template',
+    'list_languages',
+    'interactive_cli',
+    'main',
+    'advanced_code_recommendations',
+    'write_snippet_to_file',
+    'batch_generate_templates',
+    'code_search',
+)
+
+# Optional formatters/linters; resolved once at import.
+try:
+    import autopep8 as _autopep8
+except ImportError:
+    _autopep8 = None
+
+try:
+    import pyflakes.api as _pyflakes_api
+    from pyflakes.reporter import Reporter as _PyflakesReporter
+except ImportError:
+    _pyflakes_api = None
+
+# -- Static Data -- #
+
+LANGUAGES = ('python', 'java', 'perl', 'lua', 'kotlin')
+_LANG_LIST_STR = ", ".join(LANGUAGES)
+_BANNER = "Supported languages: " + _LANG_LIST_STR
+
+_HELP_TEXT = """
+Commands:
+    snippet <lang> <topic>   - Show code snippet (topics: hello, function, class)
+    format <lang>            - Format code from stdin (end with EOF)
+    lint <lang>              - Lint code from stdin (end with EOF)
+    doc <lang>               - Show documentation link
+    template <lang> <kind>   - Generate starter template (hello, function, class)
+    langs                    - List supported languages
+    help                     - Show this help
+    exit                     - Quit
+"""
+
+_TEMPLATE_KINDS = frozenset({'hello', 'function', 'class'})
+
+_EMPTY = {}
+_DEFAULT = "# No snippet found for this topic/language."
+
+_SNIPPETS = {
+    'python': {
+        'hello': 'print("Hello, world!")',
+        'function': 'def my_function(arg1, arg2):\n    """Example function."""\n    return arg1 + arg2',
+        'class': 'class MyClass:\n    def __init__(self, value):\n        self.value = value\n    def __str__(self):\n        return f"MyClass: {self.value}"',
+    },
+    'java': {
+        'hello': 'public class HelloWorld {\n    public static void main(String[] args) {\n        System.out.println("Hello, world!");\n    }\n}',
+        'function': 'public int add(int a, int b) {\n    return a + b;\n}',
+        'class': 'public class MyClass {\n    private int value;\n    public MyClass(int value) {\n        this.value = value;\n    }\n    public String toString() {\n        return "MyClass: " + value;\n    }\n}',
+    },
+    'perl': {
+        'hello': 'print "Hello, world!\\n";',
+        'function': 'sub add {\n    my ($a, $b) = @_;\n    return $a + $b;\n}',
+        'class': 'package MyClass;\nsub new {\n    my ($class, $value) = @_;\n    bless { value => $value }, $class;\n}\nsub value {\n    my $self = shift;\n    return $self->{value};\n}\n1;',
+    },
+    'lua': {
+        'hello': 'print("Hello, world!")',
+        'function': 'function add(a, b)\n    return a + b\nend',
+        'class': 'MyClass = {}\nMyClass.__index = MyClass\nfunction MyClass:new(value)\n    local inst = setmetatable({}, self)\n    inst.value = value\n    return inst\nend\nfunction MyClass:toString()\n    return "MyClass: " .. tostring(self.value)\nend',
+    },
+    'kotlin': {
+        'hello': 'fun main() {\n    println("Hello, world!")\n}',
+        'function': 'fun add(a: Int, b: Int): Int {\n    return a + b\n}',
+        'class': 'class MyClass(val value: Int) {\n    override fun toString(): String = "MyClass: $value"\n}',
+    }
+}
+
+# Share one interned object per snippet so downstream compares/hashes are cheap.
+for _topics in _SNIPPETS.values():
+    for _k in _topics:
+        _topics[_k] = sys.intern(_topics[_k])
+del _topics, _k
+
+_DOCS = {
+    'python': 'https://docs.python.org/3/',
+    'java': 'https://docs.oracle.com/en/java/',
+    'perl': 'https://perldoc.perl.org/',
+    'lua': 'https://www.lua.org/manual/5.4/',
+    'kotlin': 'https://kotlinlang.org/docs/home.html'
+}
+
+_TIPS = {
+    'python': "Consider using comprehensions for cleaner code.",
+    'java': "Use try-with-resources for automatic resource management.",
+    'perl': "Use 'strict' and 'warnings' for safer Perl scripts.",
+    'lua': "Prefer local variables for better performance and safety.",
+    'kotlin': "Prefer val over var when possible."
+}
 
 # -- Utility Functions -- #
 
-def print_header(title):
+def _print_header(title):
     print("=" * 70)
     print(title)
     print("=" * 70)
 
+def _read_stdin_blob():
+    """
+    Read all of stdin with one binary read and decode it as UTF-8.
+    Only safe before anything has been read through the sys.stdin text
+    layer, which may already hold read-ahead data.
+    """
+    buf = getattr(sys.stdin, 'buffer', None)
+    if buf is None:
+        return sys.stdin.read()
+    return buf.read().decode('utf-8', errors='replace')
+
+_lint_tls = threading.local()
+
+def _get_lint_buf():
+    """
+    Return this thread's lint output buffer, emptied for reuse.
+    """
+    buf = getattr(_lint_tls, 'buf', None)
+    if buf is None:
+        buf = _lint_tls.buf = StringIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
+
 def list_languages():
-    return ['python', 'java', 'perl', 'lua', 'kotlin']
+    return LANGUAGES
 
 def get_snippet(lang, topic):
     """
     Return a code snippet for a given language and topic.
     """
-    snippets = {
-        'python': {
-            'hello': 'print("Hello, world!")',
-            'function': 'def my_function(arg1, arg2):\n    """Example function."""\n    return arg1 + arg2',
-            'class': 'class MyClass:\n    def __init__(self, value):\n        self.value = value\n    def __str__(self):\n        return f"MyClass: {self.value}"',
-        },
-        'java': {
-            'hello': 'public class HelloWorld {\n    public static void main(String[] args) {\n        System.out.println("Hello, world!");\n    }\n}',
-            'function': 'public int add(int a, int b) {\n    return a + b;\n}',
-            'class': 'public class MyClass {\n    private int value;\n    public MyClass(int value) {\n        this.value = value;\n    }\n    public String toString() {\n        return "MyClass: " + value;\n    }\n}',
-        },
-        'perl': {
-            'hello': 'print "Hello, world!\\n";',
-            'function': 'sub add {\n    my ($a, $b) = @_;\n    return $a + $b;\n}',
-            'class': 'package MyClass;\nsub new {\n    my ($class, $value) = @_;\n    bless { value => $value }, $class;\n}\nsub value {\n    my $self = shift;\n    return $self->{value};\n}\n1;',
-        },
-        'lua': {
-            'hello': 'print("Hello, world!")',
-            'function': 'function add(a, b)\n    return a + b\nend',
-            'class': 'MyClass = {}\nMyClass.__index = MyClass\nfunction MyClass:new(value)\n    local inst = setmetatable({}, self)\n    inst.value = value\n    return inst\nend\nfunction MyClass:toString()\n    return "MyClass: " .. tostring(self.value)\nend',
-        },
-        'kotlin': {
-            'hello': 'fun main() {\n    println("Hello, world!")\n}',
-            'function': 'fun add(a: Int, b: Int): Int {\n    return a + b\n}',
-            'class': 'class MyClass(val value: Int) {\n    override fun toString(): String = "MyClass: $value"\n}',
-        }
-    }
-    return snippets.get(lang, {}).get(topic, "# No snippet found for this topic/language.")
+    return _SNIPPETS.get(lang, _EMPTY).get(topic, _DEFAULT)
 
+@lru_cache(maxsize=128)
 def format_code(lang, code):
     """
     Dummy formatter for code (for demonstration purposes).
     """
     if lang == 'python':
-        try:
-            import autopep8
-            return autopep8.fix_code(code)
-        except ImportError:
+        if _autopep8 is None:
             return "# autopep8 not installed, returning original code.\n" + code
+        return _autopep8.fix_code(code)
     elif lang == 'java':
         # Java formatting would require external tool, so just indent.
-        return textwrap.indent(code, '    ')
+        # Same result as textwrap.indent(code, '    '): whitespace-only
+        # lines are left alone.
+        return ''.join(['    ' + line if line.strip() else line
+                        for line in code.splitlines(True)])
     # ...similarly for other languages
     return code
 
+@lru_cache(maxsize=128)
 def lint_code(lang, code):
     """
     Dummy linter for demonstration.
     """
     if lang == 'python':
-        try:
-            import pyflakes.api
-            from io import StringIO
-            out = StringIO()
-            pyflakes.api.check(code, "<string>", out)
-            return out.getvalue()
-        except ImportError:
+        if _pyflakes_api is None:
             return "# pyflakes not installed, skipping lint."
+        out = _get_lint_buf()
+        _pyflakes_api.check(code, "<string>", _PyflakesReporter(out, out))
+        return out.getvalue()
     return "# Lint not supported for this language in this demo."
 
 def doc_link(lang, topic):
     """
     Return a documentation link for language/topic.
     """
-    docs = {
-        'python': 'https://docs.python.org/3/',
-        'java': 'https://docs.oracle.com/en/java/',
-        'perl': 'https://perldoc.perl.org/',
-        'lua': 'https://www.lua.org/manual/5.4/',
-        'kotlin': 'https://kotlinlang.org/docs/home.html'
-    }
-    return docs.get(lang, "# No documentation link found.")
+    return _DOCS.get(lang, "# No documentation link found.")
 
 def generate_template(lang, kind):
     """
     Generate a starter code template for a given language and kind (script/class/function).
     """
-    if kind == 'hello':
-        return get_snippet(lang, 'hello')
-    elif kind == 'function':
-        return get_snippet(lang, 'function')
-    elif kind == 'class':
-        return get_snippet(lang, 'class')
-    return "# Template not available."
+    return get_snippet(lang, kind) if kind in _TEMPLATE_KINDS else "# Template not available."
 
 # -- CLI Logic -- #
 
+def _do_snippet(args):
+    if len(args) != 2:
+        sys.stdout.write("Usage: snippet <lang> <topic>\n")
+    else:
+        lang, topic = args
+        sys.stdout.write(get_snippet(lang, topic) + "\n")
+
+def _do_template(args):
+    if len(args) != 2:
+        sys.stdout.write("Usage: template <lang> <kind>\n")
+    else:
+        lang, kind = args
+        sys.stdout.write(generate_template(lang, kind) + "\n")
+
+def _do_format(args):
+    if len(args) != 1:
+        sys.stdout.write("Usage: format <lang>\n")
+    else:
+        lang = args[0]
+        sys.stdout.write("Paste code, then Ctrl-D (EOF):\n")
+        # input() has buffered ahead in the text layer; drain it from there.
+        code = sys.stdin.read()
+        sys.stdout.write(format_code(lang, code) + "\n")
+
+def _do_lint(args):
+    if len(args) != 1:
+        sys.stdout.write("Usage: lint <lang>\n")
+    else:
+        lang = args[0]
+        sys.stdout.write("Paste code, then Ctrl-D (EOF):\n")
+        # input() has buffered ahead in the text layer; drain it from there.
+        code = sys.stdin.read()
+        sys.stdout.write(lint_code(lang, code) + "\n")
+
+def _do_doc(args):
+    if len(args) != 1:
+        sys.stdout.write("Usage: doc <lang>\n")
+    else:
+        lang = args[0]
+        sys.stdout.write(doc_link(lang, '') + "\n")
+
+def _do_langs(args):
+    sys.stdout.write(_BANNER + "\n")
+
+def _do_help(args):
+    sys.stdout.write(_HELP_TEXT)
+
+def _do_exit(args):
+    sys.stdout.write("Goodbye!\n")
+    return True
+
+# Interactive command verb -> handler(args). A truthy return ends the session.
+_HANDLERS = {
+    'snippet': _do_snippet,
+    'template': _do_template,
+    'format': _do_format,
+    'lint': _do_lint,
+    'doc': _do_doc,
+    'langs': _do_langs,
+    'help': _do_help,
+    'exit': _do_exit,
+}
+
 def interactive_cli():
-    print_header("CodeTool - Interactive Code Helper")
-    print("Supported languages: " + ", ".join(list_languages()))
+    _print_header("CodeTool - Interactive Code Helper")
+    print(_BANNER)
     print("Type 'help' for commands, 'exit' to quit.")
+    # Bind loop-invariant lookups to locals once per session.
+    _input = input
+    _write = sys.stdout.write
+    _get_handler = _HANDLERS.get
     while True:
-        cmd = input("codetool> ").strip()
-        if cmd == 'exit':
-            print("Goodbye!")
+        # Tokenise once per command; handlers get the words after the verb.
+        try:
+            parts = _input("codetool> ").split()
+        except EOFError:
+            _write("\n")
             break
-        elif cmd == 'help':
-            print("""
-Commands:
-    snippet <lang> <topic>   - Show code snippet (topics: hello, function, class)
-    format <lang>            - Format code from stdin (end with EOF)
-    lint <lang>              - Lint code from stdin (end with EOF)
-    doc <lang>               - Show documentation link
-    template <lang> <kind>   - Generate starter template (hello, function, class)
-    langs                    - List supported languages
-    help                     - Show this help
-    exit                     - Quit
-""")
-        elif cmd.startswith('langs'):
-            print("Supported languages: " + ", ".join(list_languages()))
-        elif cmd.startswith('snippet '):
-            parts = cmd.split()
-            if len(parts) != 3:
-                print("Usage: snippet <lang> <topic>")
-            else:
-                lang, topic = parts[1], parts[2]
-                print(get_snippet(lang, topic))
-        elif cmd.startswith('template '):
-            parts = cmd.split()
-            if len(parts) != 3:
-                print("Usage: template <lang> <kind>")
-            else:
-                lang, kind = parts[1], parts[2]
-                print(generate_template(lang, kind))
-        elif cmd.startswith('format '):
-            parts = cmd.split()
-            if len(parts) != 2:
-                print("Usage: format <lang>")
-            else:
-                lang = parts[1]
-                print("Paste code, then Ctrl-D (EOF):")
-                code = sys.stdin.read()
-                print(format_code(lang, code))
-        elif cmd.startswith('lint '):
-            parts = cmd.split()
-            if len(parts) != 2:
-                print("Usage: lint <lang>")
-            else:
-                lang = parts[1]
-                print("Paste code, then Ctrl-D (EOF):")
-                code = sys.stdin.read()
-                print(lint_code(lang, code))
-        elif cmd.startswith('doc '):
-            parts = cmd.split()
-            if len(parts) != 2:
-                print("Usage: doc <lang>")
-            else:
-                lang = parts[1]
-                print(doc_link(lang, ''))
-        else:
-            print("Unknown command. Type 'help'.")
+        if not parts:
+            continue
+        handler = _get_handler(parts[0])
+        if handler is None:
+            _write("Unknown command. Type 'help'.\n")
+        elif handler(parts[1:]):
+            break
+
+def _cli_format(args):
+    lang = args[0]
+    sys.stdout.write("Paste code, then Ctrl-D (EOF):\n")
+    code = _read_stdin_blob()
+    sys.stdout.write(format_code(lang, code) + "\n")
+
+def _cli_lint(args):
+    lang = args[0]
+    sys.stdout.write("Paste code, then Ctrl-D (EOF):\n")
+    code = _read_stdin_blob()
+    sys.stdout.write(lint_code(lang, code) + "\n")
+
+# Command-line verb -> (handler(args), expected len(sys.argv) or None, usage).
+# format/lint get their own handlers since nothing has touched stdin yet.
+_CLI_HANDLERS = {
+    'snippet': (_do_snippet, 4, "snippet <lang> <topic>"),
+    'template': (_do_template, 4, "template <lang> <kind>"),
+    'format': (_cli_format, 3, "format <lang>"),
+    'lint': (_cli_lint, 3, "lint <lang>"),
+    'doc': (_do_doc, 3, "doc <lang>"),
+    'langs': (_do_langs, None, "langs"),
+}
 
 def main():
     # If run with arguments, act accordingly
     if len(sys.argv) == 1:
         interactive_cli()
-    elif len(sys.argv) >= 2:
-        if sys.argv[1] == 'snippet':
-            if len(sys.argv) != 4:
-                print("Usage: snippet <lang> <topic>")
-                sys.exit(1)
-            lang, topic = sys.argv[2], sys.argv[3]
-            print(get_snippet(lang, topic))
-        elif sys.argv[1] == 'template':
-            if len(sys.argv) != 4:
-                print("Usage: template <lang> <kind>")
-                sys.exit(1)
-            lang, kind = sys.argv[2], sys.argv[3]
-            print(generate_template(lang, kind))
-        elif sys.argv[1] == 'format':
-            if len(sys.argv) != 3:
-                print("Usage: format <lang>")
-                sys.exit(1)
-            lang = sys.argv[2]
-            print("Paste code, then Ctrl-D (EOF):")
-            code = sys.stdin.read()
-            print(format_code(lang, code))
-        elif sys.argv[1] == 'lint':
-            if len(sys.argv) != 3:
-                print("Usage: lint <lang>")
-                sys.exit(1)
-            lang = sys.argv[2]
-            print("Paste code, then Ctrl-D (EOF):")
-            code = sys.stdin.read()
-            print(lint_code(lang, code))
-        elif sys.argv[1] == 'doc':
-            if len(sys.argv) != 3:
-                print("Usage: doc <lang>")
-                sys.exit(1)
-            lang = sys.argv[2]
-            print(doc_link(lang, ''))
-        elif sys.argv[1] == 'langs':
-            print("Supported languages: " + ", ".join(list_languages()))
-        else:
-            print("Unknown command. Try running with no arguments for interactive mode.")
-
-# -- Filler to reach 678 lines: (expandable for more features/snippets) --
+        return
+    entry = _CLI_HANDLERS.get(sys.argv[1])
+    if entry is None:
+        print("Unknown command. Try running with no arguments for interactive mode.")
+        return
+    handler, argc, usage = entry
+    if argc is not None and len(sys.argv) != argc:
+        print("Usage: " + usage)
+        sys.exit(1)
+    handler(sys.argv[2:])
+
+# -- Extras: (expandable for more features/snippets) --
 
 def advanced_code_recommendations(lang, code_context):
     """
     Dummy advanced code recommendation. (for demo, returns static advice)
     """
-    tips = {
-        'python': "Consider using comprehensions for cleaner code.",
-        'java': "Use try-with-resources for automatic resource management.",
-        'perl': "Use 'strict' and 'warnings' for safer Perl scripts.",
-        'lua': "Prefer local variables for better performance and safety.",
-        'kotlin': "Prefer val over var when possible."
-    }
-    return tips.get(lang, "No advice available.")
+    return _TIPS.get(lang, "No advice available.")
 
 def write_snippet_to_file(lang, topic, filename):
-    snippet = get_snippet(lang, topic)
-    with open(filename, 'w') as f:
-        f.write(snippet)
+    data = get_snippet(lang, topic).encode('utf-8')
+    with open(filename, 'wb') as f:
+        f.write(data)
     print(f"Snippet written to {filename}")
 
 def batch_generate_templates():
-    for lang in list_languages():
-        for kind in ['hello', 'function', 'class']:
+    os.makedirs("examples", exist_ok=True)
+    for lang in LANGUAGES:
+        for kind in ('hello', 'function', 'class'):
             fname = f"examples/{lang}_{kind}.txt"
-            os.makedirs("examples", exist_ok=True)
             with open(fname, 'w') as f:
                 f.write(generate_template(lang, kind))
 
@@ -264,113 +359,5 @@ def code_search(lang, keyword):
     print(f"Searching for '{keyword}' in {lang} snippets...")
     # This is just a stub. In real use, integrate with a codebase or snippet DB.
 
-# Placeholder for more code to reach 678 lines.
-_placeholder = '''
-# This section is reserved for additional utility functions, snippet expansions,
-# code analysis tools, and for padding out the script to the requested length.
-# Below are dummy function definitions to reach the required line count.
-'''
-def dummy_func_1(): pass
-def dummy_func_2(): pass
-def dummy_func_3(): pass
-def dummy_func_4(): pass
-def dummy_func_5(): pass
-def dummy_func_6(): pass
-def dummy_func_7(): pass
-def dummy_func_8(): pass
-def dummy_func_9(): pass
-def dummy_func_10(): pass
-def dummy_func_11(): pass
-def dummy_func_12(): pass
-def dummy_func_13(): pass
-def dummy_func_14(): pass
-def dummy_func_15(): pass
-def dummy_func_16(): pass
-def dummy_func_17(): pass
-def dummy_func_18(): pass
-def dummy_func_19(): pass
-def dummy_func_20(): pass
-def dummy_func_21(): pass
-def dummy_func_22(): pass
-def dummy_func_23(): pass
-def dummy_func_24(): pass
-def dummy_func_25(): pass
-def dummy_func_26(): pass
-def dummy_func_27(): pass
-def dummy_func_28(): pass
-def dummy_func_29(): pass
-def dummy_func_30(): pass
-def dummy_func_31(): pass
-def dummy_func_32(): pass
-def dummy_func_33(): pass
-def dummy_func_34(): pass
-def dummy_func_35(): pass
-def dummy_func_36(): pass
-def dummy_func_37(): pass
-def dummy_func_38(): pass
-def dummy_func_39(): pass
-def dummy_func_40(): pass
-def dummy_func_41(): pass
-def dummy_func_42(): pass
-def dummy_func_43(): pass
-def dummy_func_44(): pass
-def dummy_func_45(): pass
-def dummy_func_46(): pass
-def dummy_func_47(): pass
-def dummy_func_48(): pass
-def dummy_func_49(): pass
-def dummy_func_50(): pass
-def dummy_func_51(): pass
-def dummy_func_52(): pass
-def dummy_func_53(): pass
-def dummy_func_54(): pass
-def dummy_func_55(): pass
-def dummy_func_56(): pass
-def dummy_func_57(): pass
-def dummy_func_58(): pass
-def dummy_func_59(): pass
-def dummy_func_60(): pass
-def dummy_func_61(): pass
-def dummy_func_62(): pass
-def dummy_func_63(): pass
-def dummy_func_64(): pass
-def dummy_func_65(): pass
-def dummy_func_66(): pass
-def dummy_func_67(): pass
-def dummy_func_68(): pass
-def dummy_func_69(): pass
-def dummy_func_70(): pass
-def dummy_func_71(): pass
-def dummy_func_72(): pass
-def dummy_func_73(): pass
-def dummy_func_74(): pass
-def dummy_func_75(): pass
-def dummy_func_76(): pass
-def dummy_func_77(): pass
-def dummy_func_78(): pass
-def dummy_func_79(): pass
-def dummy_func_80(): pass
-def dummy_func_81(): pass
-def dummy_func_82(): pass
-def dummy_func_83(): pass
-def dummy_func_84(): pass
-def dummy_func_85(): pass
-def dummy_func_86(): pass
-def dummy_func_87(): pass
-def dummy_func_88(): pass
-def dummy_func_89(): pass
-def dummy_func_90(): pass
-def dummy_func_91(): pass
-def dummy_func_92(): pass
-def dummy_func_93(): pass
-def dummy_func_94(): pass
-def dummy_func_95(): pass
-def dummy_func_96(): pass
-def dummy_func_97(): pass
-def dummy_func_98(): pass
-def dummy_func_99(): pass
-def dummy_func_100(): pass
-# ... (repeat pattern to fill to 678 lines as needed) ...
-
 if __name__ == "__main__":
     main()